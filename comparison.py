@@ -5,9 +5,34 @@ Compares MLB hitters' balls in play characteristics with stadium dimensions and
 
 import pandas as pd
 import numpy as np
-import pybaseball as pyb
-from src.stadiums import get_stadium_dataframe, STADIUM_DATA
-from src.hitter_data import get_hitter_bip_stats, get_hitter_summary_stats
+import os
+from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
+from src.stadiums import get_stadium_dataframe, classify_park_factor, _PF, _DISTS
+from src.hitter_data import (
+    get_all_hitters,
+    get_hitter_bip_stats,
+    get_hitter_summary_stats,
+    get_mlbam_id_map,
+    fetch_season_bip
+)
+
+
+# Stadium attributes as columns, built once so every park can be scored at once
+_STADIUM_DF = get_stadium_dataframe()
+
+# Shortest of each stadium's L/C/R distances (STADIUM_DATA order, like _PF)
+_MIN_DIMENSION = _DISTS.min(axis=1)
+
+# Output columns taken straight from the stadium data, in the order they follow the scores
+_STADIUM_NAMES = _STADIUM_DF['stadium_name'].to_numpy()
+_STADIUM_TEAMS = _STADIUM_DF['team'].to_numpy()
+_STADIUM_COLUMNS = {
+    col: _STADIUM_DF[col].to_numpy()
+    for col in _STADIUM_DF.columns
+    if col not in ('stadium_name', 'team')
+}
 
 
 def calculate_stadium_match_score(hitter_stats, stadium_info):
@@ -76,7 +101,69 @@ def calculate_stadium_match_score(hitter_stats, stadium_info):
     return scores
 
 
-def compare_hitter_to_all_stadiums(player_id, player_name, year=2024, mlbam_id=None):
+def _score_all_stadiums(hitter_stats):
+    """
+    Vectorized version of calculate_stadium_match_score over every stadium.
+    
+    Args:
+        hitter_stats (dict): Dictionary containing hitter's BIP statistics
+        
+    Returns:
+        dict: Match score arrays (one entry per stadium, in STADIUM_DATA order)
+    """
+    park_factor = _PF
+    
+    avg_ev = hitter_stats.get('avg_exit_velocity', 0)
+    hard_hit_rate = hitter_stats.get('hard_hit_rate', 0)
+    avg_distance = hitter_stats.get('avg_distance', 0)
+    home_run_rate = hitter_stats.get('home_run_rate')
+    
+    ev_score = avg_ev * park_factor
+    
+    if avg_distance:
+        # fmax keeps the scalar max(0, nan) == 0 behaviour
+        distance_score = np.fmax(0, (avg_distance - _MIN_DIMENSION) / 50) * park_factor
+    elif hard_hit_rate:
+        distance_score = hard_hit_rate * park_factor
+    else:
+        distance_score = np.zeros_like(park_factor)
+    
+    overall_score = (
+        ev_score * 0.3 +
+        hard_hit_rate * park_factor * 100 * 0.3 +
+        distance_score * 0.2 +
+        park_factor * 20 * 0.2
+    )
+    
+    return {
+        'exit_velocity_score': ev_score,
+        'hard_hit_score': hard_hit_rate * park_factor * 100,
+        'distance_score': distance_score,
+        'park_factor_boost': park_factor,
+        'overall_match_score': overall_score,
+        'expected_home_runs': home_run_rate * park_factor * 100 if home_run_rate else None,
+        'stadium_advantage': classify_park_factor(park_factor)
+    }
+
+
+def calculate_stadium_match_score_bulk(hitter_stats):
+    """
+    Calculate a hitter's overall match score at every stadium at once.
+    
+    Args:
+        hitter_stats (dict): Dictionary containing hitter's BIP statistics
+        
+    Returns:
+        np.ndarray: Overall match scores, one per stadium in STADIUM_DATA order
+    """
+    if hitter_stats is None:
+        return None
+    
+    return _score_all_stadiums(hitter_stats)['overall_match_score']
+
+
+def compare_hitter_to_all_stadiums(player_id, player_name, year=2024, mlbam_id=None, season_bip=None,
+                                   return_records=False, bip=None):
     """
     Compare a single hitter's profile to all MLB stadiums.
     
@@ -85,35 +172,63 @@ def compare_hitter_to_all_stadiums(player_id, player_name, year=2024, mlbam_id=N
         player_name (str): Player name
         year (int): Year to analyze
         mlbam_id (int): Optional MLBAM player ID
+        season_bip (dict): Optional output of fetch_season_bip
+        return_records (bool): Return a list of row dicts instead of a DataFrame
+        bip (pd.DataFrame): Optional BIP data already fetched for this hitter
         
     Returns:
         pd.DataFrame: DataFrame with comparison results for all stadiums
+            (list of dicts if return_records is True)
     """
-    hitter_stats = get_hitter_summary_stats(player_id, year, mlbam_id)
+    hitter_stats = get_hitter_summary_stats(player_id, year, mlbam_id, season_bip, bip)
     
     if hitter_stats is None:
-        return pd.DataFrame()
+        return [] if return_records else pd.DataFrame()
     
-    comparisons = []
+    # Every column is a full-length array, so the frame is assembled without
+    # per-row work or scalar broadcasting
+    num_stadiums = len(_STADIUM_NAMES)
+    scores = _score_all_stadiums(hitter_stats)
+    if scores['expected_home_runs'] is None:
+        scores['expected_home_runs'] = np.full(num_stadiums, None, dtype=object)
     
-    for stadium_name, stadium_info in STADIUM_DATA.items():
-        match_scores = calculate_stadium_match_score(hitter_stats, stadium_info)
-        
-        if match_scores:
-            comparison = {
-                'player_id': player_id,
-                'player_name': player_name,
-                'stadium_name': stadium_name,
-                'team': stadium_info['team'],
-                **match_scores,
-                **stadium_info
-            }
-            comparisons.append(comparison)
+    columns = {
+        'player_id': np.full(num_stadiums, player_id),
+        'player_name': np.full(num_stadiums, player_name, dtype=object),
+        'stadium_name': _STADIUM_NAMES,
+        'team': _STADIUM_TEAMS,
+        **scores,
+        **_STADIUM_COLUMNS
+    }
     
-    return pd.DataFrame(comparisons)
+    if return_records:
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+    
+    return pd.DataFrame(columns)
+
+
+def _compare_one_hitter(player_id, player_name, id_map, year, season_bip):
+    """Compare one hitter to all stadiums (run from a worker thread)."""
+    return compare_hitter_to_all_stadiums(player_id, player_name, year, id_map.get(player_id), season_bip,
+                                          return_records=True)
+
+
+# Shared inputs for process-pool workers, set once per process by _init_process_worker
+_WORKER_STATE = {}
+
+
+def _init_process_worker(id_map, year, season_bip):
+    """Hand each worker process the shared inputs once instead of pickling them per task."""
+    _WORKER_STATE.update(id_map=id_map, year=year, season_bip=season_bip)
+
+
+def _compare_one_hitter_in_process(player_id, player_name):
+    """Compare one hitter to all stadiums (run from a worker process)."""
+    return _compare_one_hitter(player_id, player_name, _WORKER_STATE['id_map'],
+                               _WORKER_STATE['year'], _WORKER_STATE['season_bip'])
 
 
-def compare_all_hitters_to_stadiums(year=2024, min_pa=100, top_n=None):
+def compare_all_hitters_to_stadiums(year=2024, min_pa=100, top_n=None, max_workers=16, use_processes=False):
     """
     Compare all MLB hitters to all stadiums.
     
@@ -121,12 +236,15 @@ def compare_all_hitters_to_stadiums(year=2024, min_pa=100, top_n=None):
         year (int): Year to analyze
         min_pa (int): Minimum plate appearances required
         top_n (int): If specified, only analyze top N hitters by PA
+        max_workers (int): Number of threads fetching Statcast data concurrently
+            (or worker processes, capped at the CPU count, with use_processes)
+        use_processes (bool): Spread hitters over worker processes instead of
+            threads. Threads suit the default download-bound sweep; processes
+            only pay off when the data is already cached and scoring dominates
         
     Returns:
         pd.DataFrame: DataFrame with all comparisons
     """
-    from src.hitter_data import get_all_hitters
-    
     print("Fetching all hitters...")
     hitters = get_all_hitters(year)
     
@@ -144,33 +262,33 @@ def compare_all_hitters_to_stadiums(year=2024, min_pa=100, top_n=None):
     
     print(f"Comparing {len(hitters)} hitters to all stadiums...")
     
-    all_comparisons = []
+    # Resolve every MLBAM ID up front for better Statcast data access
+    id_map = get_mlbam_id_map(hitters)
+    player_ids = hitters['IDfg'].to_numpy()
+    player_names = hitters['full_name'].fillna('Player ' + hitters['IDfg'].astype(str)).to_numpy()
     
-    for idx, row in hitters.iterrows():
-        player_id = row['IDfg']
-        player_name = row.get('full_name', f"Player {player_id}")
-        
-        # Try to get MLBAM ID for better Statcast data access
-        mlbam_id = None
-        try:
-            from src.hitter_data import get_all_hitters
-            player_lookup = pyb.playerid_reverse_lookup([player_id], key_type='fangraphs')
-            if len(player_lookup) > 0 and 'key_mlbam' in player_lookup.columns:
-                mlbam_id = player_lookup.iloc[0]['key_mlbam']
-        except:
-            pass
-        
-        print(f"Processing {player_name}...")
-        
-        comparisons = compare_hitter_to_all_stadiums(player_id, player_name, year, mlbam_id)
-        
-        if len(comparisons) > 0:
-            all_comparisons.append(comparisons)
+    # A whole-league sweep is cheaper as one season-wide download than a
+    # Statcast query per hitter; a top-N sweep keeps the narrow queries
+    season_bip = fetch_season_bip(year) if top_n is None else None
     
-    if len(all_comparisons) > 0:
-        return pd.concat(all_comparisons, ignore_index=True)
+    if use_processes:
+        executor = ProcessPoolExecutor(max_workers=min(max_workers, os.cpu_count() or 1),
+                                       initializer=_init_process_worker,
+                                       initargs=(id_map, year, season_bip))
+        tasks = executor.map(_compare_one_hitter_in_process, player_ids, player_names, chunksize=4)
     else:
-        return pd.DataFrame()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        tasks = executor.map(_compare_one_hitter, player_ids, player_names,
+                             repeat(id_map), repeat(year), repeat(season_bip))
+    
+    with executor:
+        results = tqdm(tasks, total=len(player_ids), desc="Comparing hitters")
+        all_records = []
+        for records in results:
+            all_records.extend(records)
+    
+    # One DataFrame for the whole sweep instead of one per hitter plus a concat
+    return pd.DataFrame(all_records)
 
 
 def get_best_stadium_matches(hitter_name, comparisons_df, top_n=5):
@@ -203,13 +321,17 @@ def get_stadium_rankings(comparisons_df):
     Returns:
         pd.DataFrame: DataFrame with stadium rankings
     """
-    stadium_stats = comparisons_df.groupby('stadium_name').agg({
-        'overall_match_score': ['mean', 'std', 'count'],
-        'park_factor': 'first',
-        'team': 'first'
-    }).reset_index()
+    # Only the aggregated columns go through the groupby, and named aggregation
+    # yields flat columns directly; the only sort needed is by score
+    ranking_columns = ['stadium_name', 'overall_match_score', 'park_factor', 'team']
+    stadium_stats = comparisons_df[ranking_columns].groupby('stadium_name', sort=False, observed=True).agg(
+        avg_match_score=('overall_match_score', 'mean'),
+        std_match_score=('overall_match_score', 'std'),
+        num_hitters=('overall_match_score', 'count'),
+        park_factor=('park_factor', 'first'),
+        team=('team', 'first')
+    ).reset_index()
     
-    stadium_stats.columns = ['stadium_name', 'avg_match_score', 'std_match_score', 'num_hitters', 'park_factor', 'team']
     stadium_stats = stadium_stats.sort_values('avg_match_score', ascending=False)
     
     return stadium_stats
@@ -3,51 +3,190 @@ MLB Hitter Data Module
 Fetches and processes balls in play data for MLB hitters.
 """
 
+import numpy as np
 import pandas as pd
 import pybaseball as pyb
 from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+import functools
+import glob
+import inspect
+import threading
 import time
+import os
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; summaries fall back to pandas reductions
+    NUMBA_AVAILABLE = False
+
+
+# Cache Statcast/FanGraphs downloads on disk so repeat runs skip the network.
+# Set PYB_CACHE to move the cache away from pybaseball's default directory.
+pyb.cache.config.cache_directory = os.path.expanduser(
+    os.environ.get('PYB_CACHE', pyb.cache.config.cache_directory)
+)
+pyb.cache.config.cache_type = 'parquet'
+pyb.cache.enable()
+
+# Parquet copies of fetched hitter/BIP frames, keyed by call arguments.
+# Set MLB_CACHE to move it; main.py --refresh clears it.
+DISK_CACHE_DIR = os.path.expanduser(
+    os.environ.get('MLB_CACHE', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
+)
+
+# Caps concurrent Statcast requests when hitters are fetched from a thread pool
+_STATCAST_SEMAPHORE = threading.Semaphore(8)
+
+# Statcast columns kept for balls in play; everything downstream reads only these
+BIP_COLUMNS = [
+    'batter', 'launch_speed', 'launch_angle', 'bb_type', 'events', 'barrel',
+    'hit_distance_sc', 'hc_x', 'hc_y', 'estimated_ba_using_speedangle',
+]
+
+# FanGraphs team abbreviations that differ from the ones Statcast queries expect
+FANGRAPHS_TO_STATCAST_TEAM = {
+    'ARI': 'AZ',
+    'CHW': 'CWS',
+    'KCR': 'KC',
+    'SDP': 'SD',
+    'SFG': 'SF',
+    'TBR': 'TB',
+    'WSN': 'WSH',
+}
+
+
+def disk_cache(name):
+    """
+    Memoize a DataFrame-returning function to parquet files under DISK_CACHE_DIR.
+    
+    The file name is built from name and the call's arguments. Empty results are
+    not stored (so failed fetches are retried), and if no parquet engine is
+    installed the wrapped function is simply called every time.
+    
+    Args:
+        name (str): Prefix for the cache files of this function
+        
+    Returns:
+        callable: Decorator applying the cache
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = '_'.join([name] + [str(value) for value in bound.arguments.values()])
+            path = os.path.join(DISK_CACHE_DIR, f"{key}.parquet")
+            
+            if os.path.exists(path):
+                try:
+                    return pd.read_parquet(path)
+                except Exception:
+                    pass  # Unreadable or no parquet engine: fetch again
+            
+            result = func(*args, **kwargs)
+            if isinstance(result, pd.DataFrame) and len(result) > 0:
+                try:
+                    os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+                    # Write then rename so a concurrent reader never sees a partial file
+                    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                    result.to_parquet(tmp_path)
+                    os.replace(tmp_path, path)
+                except Exception:
+                    pass
+            return result
+        
+        return wrapper
+    return decorator
+
+
+def clear_disk_cache():
+    """Delete the cached hitter/BIP frames so the next calls fetch fresh data."""
+    # Only the files disk_cache writes: MLB_CACHE may point at a directory holding other data
+    for path in glob.glob(os.path.join(DISK_CACHE_DIR, '*.parquet')) + \
+            glob.glob(os.path.join(DISK_CACHE_DIR, '*.parquet.*.tmp')):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    try:
+        os.rmdir(DISK_CACHE_DIR)  # Only succeeds once the directory is empty
+    except OSError:
+        pass
+    _fetch_all_hitters.cache_clear()
 
 
 def get_all_hitters(year=2024):
     """
     Get all MLB hitters for a given year.
     
+    Results are memoized per year; each call returns its own copy.
+    
     Args:
         year (int): Year to fetch data for (default: 2024)
         
     Returns:
         pd.DataFrame: DataFrame containing hitter information
     """
+    return _fetch_all_hitters(year).copy()
+
+
+@functools.lru_cache(maxsize=8)
+def _fetch_all_hitters(year):
+    """Download and merge the hitter list behind get_all_hitters."""
     print(f"Fetching hitter data for {year}...")
     
     try:
-        # Get batting stats for all players
-        batting_stats = pyb.batting_stats(year, qual=0)  # qual=0 means no minimum PA requirement
-        
-        # Get player info to match names
-        player_info = pyb.playerid_reverse_lookup(batting_stats['IDfg'].tolist(), key_type='fangraphs')
-        
-        # Merge to get player names
-        hitters = batting_stats.merge(
-            player_info[['key_fangraphs', 'name_first', 'name_last']],
-            left_on='IDfg',
-            right_on='key_fangraphs',
-            how='left'
-        )
-        
-        # Create full name
-        hitters['full_name'] = hitters['name_first'] + ' ' + hitters['name_last']
-        
+        hitters = _fetch_fangraphs_hitters(year)
         print(f"Found {len(hitters)} hitters")
         return hitters
         
     except Exception as e:
         print(f"Error fetching hitter data: {e}")
         print("Attempting alternative method...")
+        # Not written to the disk cache, so a transient FanGraphs failure isn't kept
         return get_hitters_alternative(year)
 
 
+@disk_cache('hitters')
+def _fetch_fangraphs_hitters(year):
+    """FanGraphs batting stats merged with player names; raises if the download fails."""
+    # Get batting stats for all players
+    batting_stats = pyb.batting_stats(year, qual=0)  # qual=0 means no minimum PA requirement
+    
+    # Get player info to match names
+    player_info = pyb.playerid_reverse_lookup(batting_stats['IDfg'].tolist(), key_type='fangraphs')
+    
+    # Merge to get player names
+    hitters = batting_stats.merge(
+        player_info[['key_fangraphs', 'key_mlbam', 'name_first', 'name_last']],
+        left_on='IDfg',
+        right_on='key_fangraphs',
+        how='left'
+    )
+    
+    # Create full name
+    hitters['full_name'] = hitters['name_first'] + ' ' + hitters['name_last']
+    # Lowercased once so name searches don't re-lowercase the roster per query,
+    # blank for unnamed players so searches need no NA handling, and Arrow-backed
+    # when pyarrow is installed so the substring scan runs natively
+    hitters['_name_lower'] = _as_arrow_string(hitters['full_name'].str.lower().fillna(''))
+
+    return hitters
+
+
+def _as_arrow_string(series):
+    """Convert a string Series to the pyarrow-backed dtype, if pyarrow is available."""
+    try:
+        return series.astype('string[pyarrow]')
+    except ImportError:
+        return series
+
+
 def get_hitters_alternative(year=2024):
     """
     Alternative method to get hitters if primary method fails.
@@ -84,7 +223,126 @@ def get_hitters_alternative(year=2024):
         return pd.DataFrame()
 
 
-def get_hitter_bip_stats(player_id, year=2024, mlbam_id=None):
+def get_mlbam_id_map(hitters):
+    """
+    Map FanGraphs player IDs to MLBAM IDs for a set of hitters.
+    
+    Uses the key_mlbam column from get_all_hitters when present, otherwise
+    resolves every ID with a single batched lookup.
+    
+    Args:
+        hitters (pd.DataFrame): DataFrame of hitters with an IDfg column
+        
+    Returns:
+        dict: Mapping of FanGraphs ID to MLBAM ID
+    """
+    if 'key_mlbam' in hitters.columns:
+        return dict(zip(hitters['IDfg'], hitters['key_mlbam']))
+    
+    try:
+        lookup = pyb.playerid_reverse_lookup(hitters['IDfg'].tolist(), key_type='fangraphs')
+        return dict(zip(lookup['key_fangraphs'], lookup['key_mlbam']))
+    except:
+        return {}
+
+
+def _filter_bip(statcast_data):
+    """Keep only tracked balls in play (exclude strikeouts and walks) and the columns used downstream."""
+    mask = (
+        (statcast_data['type'] == 'X') &  # Balls in play
+        (statcast_data['launch_speed'].notna()) &
+        (statcast_data['launch_angle'].notna())
+    )
+    columns = [col for col in BIP_COLUMNS if col in statcast_data.columns]
+    bip = statcast_data.loc[mask, columns]
+    
+    # Low-cardinality labels as categoricals so equality checks compare int8 codes
+    return bip.astype({col: 'category' for col in ('bb_type', 'events') if col in bip.columns})
+
+
+def fetch_season_bip(year=2024):
+    """
+    Get balls in play for every hitter from a single season-wide Statcast pull.
+    
+    Args:
+        year (int): Year to fetch data for
+        
+    Returns:
+        dict: Mapping of MLBAM batter ID to that hitter's BIP DataFrame, or None
+            if the pull failed or came back empty (callers then query each hitter)
+    """
+    print(f"Fetching {year} Statcast data for all hitters...")
+    
+    try:
+        bip = _fetch_statcast_bip(year)
+    except Exception as e:
+        print(f"Error fetching season Statcast data: {e}")
+        return None
+    
+    if len(bip) == 0:
+        return None
+    
+    return _group_bip_by_batter(bip)
+
+
+def get_team_bip(team, year=2024):
+    """
+    Get balls in play from every game a team played, from one Statcast pull.
+    
+    Args:
+        team (str): Team abbreviation, FanGraphs (e.g. 'KCR') or Statcast (e.g. 'KC') style
+        year (int): Year to fetch data for
+        
+    Returns:
+        dict: Mapping of MLBAM batter ID to that hitter's BIP DataFrame, or None
+            if the pull failed or came back empty (callers then query each hitter)
+    """
+    statcast_team = FANGRAPHS_TO_STATCAST_TEAM.get(team, team)
+    
+    try:
+        with _STATCAST_SEMAPHORE:
+            bip = _fetch_statcast_bip(year, team=statcast_team)
+    except Exception as e:
+        print(f"Error fetching Statcast data for {team}: {e}")
+        return None
+    
+    if len(bip) == 0:
+        return None
+    
+    return _group_bip_by_batter(bip)
+
+
+@disk_cache('statcast_bip')
+def _fetch_statcast_bip(year, team=None):
+    """Season-wide Statcast pull (optionally one team's games), filtered to balls in play."""
+    statcast_data = pyb.statcast(f'{year}-03-01', f'{year}-11-30', team=team)
+    if statcast_data is None or len(statcast_data) == 0:
+        return pd.DataFrame()
+    
+    return _filter_bip(statcast_data)
+
+
+@disk_cache('batter_bip')
+def _fetch_batter_bip(batter_id, year):
+    """One hitter's Statcast pull for a season, filtered to balls in play."""
+    with _STATCAST_SEMAPHORE:
+        statcast_data = pyb.statcast_batter(f'{year}-01-01', f'{year}-12-31', batter_id)
+    
+    if statcast_data is None or len(statcast_data) == 0:
+        return pd.DataFrame()
+    
+    return _filter_bip(statcast_data)
+
+
+def _group_bip_by_batter(bip):
+    """Split multi-hitter BIP data into per-batter DataFrames."""
+    if len(bip) == 0:
+        return {}
+    
+    return dict(tuple(bip.groupby('batter')))
+
+
+def get_hitter_bip_stats(player_id, year=2024, mlbam_id=None, season_bip=None):
     """
     Get balls in play statistics for a specific hitter.
     
@@ -92,9 +350,13 @@ def get_hitter_bip_stats(player_id, year=2024, mlbam_id=None):
         player_id (int): FanGraphs player ID
         year (int): Year to fetch data for
         mlbam_id (int): Optional MLBAM player ID (if available)
+        season_bip (dict): Optional output of fetch_season_bip (or get_team_bip)
+            to read from instead of querying Statcast for this hitter
         
     Returns:
-        pd.DataFrame: DataFrame containing BIP statistics
+        pd.DataFrame: DataFrame containing BIP statistics (the BIP_COLUMNS
+            present in the Statcast data). Frames taken from season_bip are
+            shared, so copy before modifying them.
     """
     try:
         # Try to get MLBAM ID if not provided
@@ -106,32 +368,26 @@ def get_hitter_bip_stats(player_id, year=2024, mlbam_id=None):
             except:
                 pass
         
+        # Season-wide data is already filtered and keyed by MLBAM ID
+        if season_bip is not None:
+            if mlbam_id is None or pd.isna(mlbam_id):
+                return pd.DataFrame()
+            return season_bip.get(int(mlbam_id), pd.DataFrame())
+        
         # Get Statcast data for the player
         # statcast_batter uses MLBAM ID, not FanGraphs ID
         if mlbam_id is not None and pd.notna(mlbam_id):
-            statcast_data = pyb.statcast_batter(f'{year}-01-01', f'{year}-12-31', int(mlbam_id))
+            return _fetch_batter_bip(int(mlbam_id), year)
         else:
             # Fallback: try with FanGraphs ID (may not work)
-            statcast_data = pyb.statcast_batter(f'{year}-01-01', f'{year}-12-31', player_id)
-        
-        if statcast_data is None or len(statcast_data) == 0:
-            return pd.DataFrame()
-        
-        # Filter for balls in play (exclude strikeouts and walks)
-        bip = statcast_data[
-            (statcast_data['type'] == 'X') &  # Balls in play
-            (statcast_data['launch_speed'].notna()) &
-            (statcast_data['launch_angle'].notna())
-        ].copy()
-        
-        return bip
+            return _fetch_batter_bip(player_id, year)
         
     except Exception as e:
         # Silently fail - not all players have Statcast data
         return pd.DataFrame()
 
 
-def get_hitter_summary_stats(player_id, year=2024, mlbam_id=None):
+def get_hitter_summary_stats(player_id, year=2024, mlbam_id=None, season_bip=None, bip=None):
     """
     Get summary statistics for a hitter's balls in play.
     
@@ -139,11 +395,15 @@ def get_hitter_summary_stats(player_id, year=2024, mlbam_id=None):
         player_id (int): FanGraphs player ID
         year (int): Year to fetch data for
         mlbam_id (int): Optional MLBAM player ID (if available)
+        season_bip (dict): Optional output of fetch_season_bip or get_team_bip
+        bip (pd.DataFrame): Optional BIP data already returned by
+            get_hitter_bip_stats, to avoid downloading it again
         
     Returns:
         dict: Dictionary containing summary statistics
     """
-    bip = get_hitter_bip_stats(player_id, year, mlbam_id)
+    if bip is None:
+        bip = get_hitter_bip_stats(player_id, year, mlbam_id, season_bip)
     
     if len(bip) == 0:
         return None
@@ -152,27 +412,169 @@ def get_hitter_summary_stats(player_id, year=2024, mlbam_id=None):
         'player_id': player_id,
         'year': year,
         'total_bip': len(bip),
-        'avg_exit_velocity': bip['launch_speed'].mean(),
-        'max_exit_velocity': bip['launch_speed'].max(),
-        'avg_launch_angle': bip['launch_angle'].mean(),
-        'barrel_rate': (bip['barrel'] == 1).sum() / len(bip) if 'barrel' in bip.columns else None,
-        'hard_hit_rate': (bip['launch_speed'] >= 95).sum() / len(bip),
-        'pull_rate': (bip['bb_type'] == 'pull').sum() / len(bip) if 'bb_type' in bip.columns else None,
-        'oppo_rate': (bip['bb_type'] == 'oppo').sum() / len(bip) if 'bb_type' in bip.columns else None,
-        'home_run_rate': (bip['events'] == 'home_run').sum() / len(bip) if 'events' in bip.columns else None,
-        'avg_distance': bip['hit_distance_sc'].mean() if 'hit_distance_sc' in bip.columns else None,
     }
+    summary.update(_summarize_bip_fused(bip) if NUMBA_AVAILABLE else _summarize_bip(bip))
     
     return summary
 
 
-def get_all_hitters_bip_summary(year=2024, min_pa=100):
+def _summarize_bip(bip):
+    """NumPy reductions behind get_hitter_summary_stats (used when Numba is unavailable)."""
+    n = len(bip)
+    columns = bip.columns
+    launch_speed = _float_column(bip, 'launch_speed')
+    launch_angle = _float_column(bip, 'launch_angle')
+    distance = _float_column(bip, 'hit_distance_sc')
+    distance = distance[~np.isnan(distance)]
+    bb_type_codes, (pull_code, oppo_code) = _category_codes(bip, 'bb_type', ('pull', 'oppo'))
+    events_codes, (home_run_code,) = _category_codes(bip, 'events', ('home_run',))
+    
+    return {
+        'avg_exit_velocity': launch_speed.mean(),
+        'max_exit_velocity': launch_speed.max(),
+        'avg_launch_angle': launch_angle.mean(),
+        'barrel_rate': np.count_nonzero(_float_column(bip, 'barrel') == 1) / n if 'barrel' in columns else None,
+        'hard_hit_rate': np.count_nonzero(launch_speed >= 95) / n,
+        'pull_rate': np.count_nonzero(bb_type_codes == pull_code) / n if 'bb_type' in columns else None,
+        'oppo_rate': np.count_nonzero(bb_type_codes == oppo_code) / n if 'bb_type' in columns else None,
+        'home_run_rate': np.count_nonzero(events_codes == home_run_code) / n if 'events' in columns else None,
+        'avg_distance': (distance.mean() if len(distance) else np.nan) if 'hit_distance_sc' in columns else None,
+    }
+
+
+def _bip_reduce(launch_speed, launch_angle, barrel, bb_type_code, events_code, distance,
+                pull_code, oppo_code, home_run_code):
+    """Accumulate every summary total in a single pass over a hitter's BIP arrays."""
+    sum_speed = 0.0
+    max_speed = -np.inf
+    sum_angle = 0.0
+    sum_distance = 0.0
+    count_distance = 0
+    count_barrel = 0
+    count_hard_hit = 0
+    count_pull = 0
+    count_oppo = 0
+    count_home_run = 0
+    
+    for i in range(launch_speed.shape[0]):
+        speed = launch_speed[i]
+        sum_speed += speed
+        if speed > max_speed:
+            max_speed = speed
+        if speed >= 95.0:
+            count_hard_hit += 1
+        
+        sum_angle += launch_angle[i]
+        
+        if barrel[i] == 1.0:
+            count_barrel += 1
+        if bb_type_code[i] == pull_code:
+            count_pull += 1
+        elif bb_type_code[i] == oppo_code:
+            count_oppo += 1
+        if events_code[i] == home_run_code:
+            count_home_run += 1
+        
+        # Distance is missing for some tracked balls; the mean skips those
+        if not np.isnan(distance[i]):
+            sum_distance += distance[i]
+            count_distance += 1
+    
+    return (sum_speed, max_speed, sum_angle, sum_distance, count_distance,
+            count_barrel, count_hard_hit, count_pull, count_oppo, count_home_run)
+
+
+def _read_only(array):
+    """
+    Mark an array read-only. pandas hands out read-only views, and Numba compiles
+    a separate specialization per writeability, so every reducer input is kept read-only.
+    """
+    array.setflags(write=False)
+    return array
+
+
+if NUMBA_AVAILABLE:
+    _bip_reduce = njit(cache=True)(_bip_reduce)
+    # Compile once at import with the argument types _summarize_bip_fused uses;
+    # cache=True writes the build to __pycache__ so later runs just load it
+    _bip_reduce(_read_only(np.zeros(1)), _read_only(np.zeros(1)), _read_only(np.zeros(1)),
+                _read_only(np.zeros(1, dtype=np.int8)), _read_only(np.zeros(1, dtype=np.int8)),
+                _read_only(np.zeros(1)), -2, -2, -2)
+
+
+def _float_column(bip, column):
+    """Column as a float64 array (all NaN when the column is missing)."""
+    if column not in bip.columns:
+        return _read_only(np.full(len(bip), np.nan))
+    return _read_only(bip[column].to_numpy(dtype=np.float64, na_value=np.nan))
+
+
+def _category_codes(bip, column, values):
+    """Integer codes for a string column plus the code of each requested value (-2 if absent)."""
+    if column not in bip.columns:
+        return _read_only(np.full(len(bip), -1, dtype=np.int8)), tuple(-2 for _ in values)
+    
+    # Already categorical when the data came through _filter_bip
+    categorical = pd.Categorical(bip[column])
+    categories = categorical.categories
+    return _read_only(categorical.codes), tuple(categories.get_loc(v) if v in categories else -2 for v in values)
+
+
+def _summarize_bip_fused(bip):
+    """Same statistics as _summarize_bip, computed by the compiled one-pass reducer."""
+    n = len(bip)
+    columns = bip.columns
+    bb_type_codes, (pull_code, oppo_code) = _category_codes(bip, 'bb_type', ('pull', 'oppo'))
+    events_codes, (home_run_code,) = _category_codes(bip, 'events', ('home_run',))
+    
+    (sum_speed, max_speed, sum_angle, sum_distance, count_distance,
+     count_barrel, count_hard_hit, count_pull, count_oppo, count_home_run) = _bip_reduce(
+        _float_column(bip, 'launch_speed'),
+        _float_column(bip, 'launch_angle'),
+        _float_column(bip, 'barrel'),
+        bb_type_codes,
+        events_codes,
+        _float_column(bip, 'hit_distance_sc'),
+        pull_code,
+        oppo_code,
+        home_run_code
+    )
+    
+    return {
+        'avg_exit_velocity': sum_speed / n,
+        'max_exit_velocity': max_speed,
+        'avg_launch_angle': sum_angle / n,
+        'barrel_rate': count_barrel / n if 'barrel' in columns else None,
+        'hard_hit_rate': count_hard_hit / n,
+        'pull_rate': count_pull / n if 'bb_type' in columns else None,
+        'oppo_rate': count_oppo / n if 'bb_type' in columns else None,
+        'home_run_rate': count_home_run / n if 'events' in columns else None,
+        'avg_distance': (sum_distance / count_distance if count_distance else np.nan) if 'hit_distance_sc' in columns else None,
+    }
+
+
+def _summarize_one_hitter(player_id, player_name, team, id_map, year, season_bip):
+    """Build the BIP summary for one hitter (run from a worker thread)."""
+    try:
+        summary = get_hitter_summary_stats(player_id, year, id_map.get(player_id), season_bip)
+        if summary:
+            summary['name'] = player_name
+            summary['team'] = team
+        return summary
+    except Exception as e:
+        print(f"Error processing hitter {player_name}: {e}")
+        return None
+
+
+def get_all_hitters_bip_summary(year=2024, min_pa=100, max_workers=16, team=None):
     """
     Get summary statistics for all hitters with minimum plate appearances.
     
     Args:
         year (int): Year to fetch data for
         min_pa (int): Minimum plate appearances required
+        max_workers (int): Number of threads fetching Statcast data concurrently
+        team (str): If specified, only summarize hitters on this team (FanGraphs abbreviation)
         
     Returns:
         pd.DataFrame: DataFrame containing summary statistics for all hitters
@@ -184,20 +586,26 @@ def get_all_hitters_bip_summary(year=2024, min_pa=100):
     
     # Filter by minimum plate appearances
     hitters = hitters[hitters['PA'] >= min_pa]
+    if team is not None:
+        hitters = hitters[hitters['Team'] == team]
     
     print(f"Processing BIP stats for {len(hitters)} hitters...")
     
-    summaries = []
-    for idx, row in tqdm(hitters.iterrows(), total=len(hitters), desc="Processing hitters"):
-        try:
-            summary = get_hitter_summary_stats(row['IDfg'], year)
-            if summary:
-                summary['name'] = row.get('full_name', f"Player {row['IDfg']}")
-                summary['team'] = row.get('Team', 'Unknown')
-                summaries.append(summary)
-            time.sleep(0.1)  # Rate limiting
-        except Exception as e:
-            print(f"Error processing hitter {row.get('full_name', row['IDfg'])}: {e}")
-            continue
-    
-    return pd.DataFrame(summaries)
+    id_map = get_mlbam_id_map(hitters)
+    player_ids = hitters['IDfg'].to_numpy()
+    player_names = hitters['full_name'].fillna('Player ' + hitters['IDfg'].astype(str)).to_numpy()
+    teams = hitters['Team'].fillna('Unknown').to_numpy()
+    
+    # One download replaces a Statcast query per hitter: the team's games
+    # when summarizing a single team, otherwise the whole season
+    season_bip = get_team_bip(team, year) if team is not None else fetch_season_bip(year)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(tqdm(
+            executor.map(_summarize_one_hitter, player_ids, player_names, teams,
+                         repeat(id_map), repeat(year), repeat(season_bip)),
+            total=len(player_ids),
+            desc="Processing hitters"
+        ))
+    
+    return pd.DataFrame([summary for summary in results if summary])
@@ -1,9 +1,21 @@
+import math
+import os
+import zipfile
 import pandas as pd
 import numpy as np
 import pybaseball as pyb
 import matplotlib.pyplot as plt
+from scipy.interpolate import RegularGridInterpolator
 from src.hitter_data import get_all_hitters, get_hitter_bip_stats
-from src.stadiums import get_stadium_dataframe, STADIUM_DATA
+from src.stadiums import (
+    get_stadium_dataframe, classify_park_factor, get_fence_params_vec, air_density, STADIUM_DATA, _NAMES, _RHO
+)
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; trajectories fall back to the NumPy integrator
+    NUMBA_AVAILABLE = False
 
 class BaseballPhysics:
     """Simulates 3D trajectory with Drag and Gravity."""
@@ -11,57 +23,320 @@ class BaseballPhysics:
     CD = 0.3     # Drag coefficient
     MASS = 0.3125 
     AREA = 0.0458 
+    DT = 0.05  # RK4 step (s)
+    MAX_STEPS = 400  # 20 s of flight at DT, far beyond any batted ball
+    
+    # Grid for the precomputed height table (mph, degrees, air density, feet);
+    # the density axis spans sea level to ~5,600 ft
+    TABLE_V0 = np.arange(60.0, 121.0, 1.0)
+    TABLE_LA = np.arange(0.0, 51.0, 1.0)
+    TABLE_RHO = np.linspace(0.062, 0.075, 14)
+    TABLE_DIST = np.arange(280.0, 451.0, 5.0)
+    TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'trajectory_table.npz')
 
     @staticmethod
     def get_air_density(altitude):
         """Calculates air density (rho) based on elevation."""
-        return 0.075 * np.exp(-altitude / 30000)
+        return air_density(altitude)
+
+    @staticmethod
+    def get_height_at_distance(v0_mph, launch_angle, target_dist, rho):
+        """
+        Calculates ball height when it reaches the fence distance.
+        rho is the park's air density (see get_air_density / the stadium '_rho' field).
+        Takes scalars or arrays (rho included) and advances every trajectory in lockstep.
+        """
+        v0_mph, launch_angle, target_dist, rho = np.broadcast_arrays(
+            np.asarray(v0_mph, dtype=np.float64),
+            np.asarray(launch_angle, dtype=np.float64),
+            np.asarray(target_dist, dtype=np.float64),
+            np.asarray(rho, dtype=np.float64)
+        )
+        if NUMBA_AVAILABLE:
+            heights = _heights_batch(v0_mph.astype(np.float64).ravel(), launch_angle.astype(np.float64).ravel(),
+                                     target_dist.astype(np.float64).ravel(), rho.astype(np.float64).ravel())
+            return heights.reshape(v0_mph.shape)[()]
+        # The NumPy path is memory-bound, so it steps in float32 (well under 0.01 ft of drift)
+        heights = BaseballPhysics._integrate(v0_mph.astype(np.float32), launch_angle.astype(np.float32),
+                                             target_dist.astype(np.float32), rho.astype(np.float32))
+        return np.asarray(heights, dtype=np.float64)[()]
+
+    @staticmethod
+    def get_height_from_table(v0_mph, launch_angle, target_dist, rho):
+        """
+        Table-lookup version of get_height_at_distance.
+        Rows inside the table grid are interpolated; anything outside it is integrated.
+        """
+        v0_mph, launch_angle, target_dist, rho = np.broadcast_arrays(
+            np.asarray(v0_mph, dtype=np.float64),
+            np.asarray(launch_angle, dtype=np.float64),
+            np.asarray(target_dist, dtype=np.float64),
+            np.asarray(rho, dtype=np.float64)
+        )
+        points = np.stack([v0_mph, launch_angle, rho, target_dist], axis=-1)
+        grids = (BaseballPhysics.TABLE_V0, BaseballPhysics.TABLE_LA,
+                 BaseballPhysics.TABLE_RHO, BaseballPhysics.TABLE_DIST)
+        in_grid = np.ones(v0_mph.shape, dtype=bool)
+        for axis, grid in enumerate(grids):
+            in_grid &= (points[..., axis] >= grid[0]) & (points[..., axis] <= grid[-1])
+        
+        heights = np.empty(v0_mph.shape)
+        if in_grid.any():
+            heights[in_grid] = _height_table()(points[in_grid])
+        outside = ~in_grid
+        if outside.any():
+            heights[outside] = BaseballPhysics.get_height_at_distance(
+                v0_mph[outside], launch_angle[outside], target_dist[outside], rho[outside]
+            )
+        return heights[()]
 
     @staticmethod
-    def get_height_at_distance(v0_mph, launch_angle, target_dist, altitude):
-        """Calculates ball height when it reaches the fence distance."""
-        rho = BaseballPhysics.get_air_density(altitude)
+    def _integrate(v0_mph, launch_angle, target_dist, rho):
+        """
+        NumPy integrator behind get_height_at_distance (used when Numba is unavailable).
+        State keeps the dtype of the inputs; Python float constants don't upcast float32.
+        """
+        def accel(vx, vy):
+            v = np.sqrt(vx * vx + vy * vy)
+            # F = ma -> a = F/m (slugs)
+            k = 0.5 * rho * v * BaseballPhysics.CD * BaseballPhysics.AREA / 0.0097
+            return -k * vx, -BaseballPhysics.G - k * vy
+        
         v0 = v0_mph * 1.46667
         theta = np.radians(launch_angle)
         vx, vy = v0 * np.cos(theta), v0 * np.sin(theta)
-        x, y, dt = 0.0, 3.0, 0.01
+        x, y, dt = np.zeros_like(v0), np.full_like(v0, 3.0), BaseballPhysics.DT
+        height = y.copy()
+        # A ball stops updating once it reaches the fence or the ground
+        active = (x < target_dist) & (y > 0)
         
-        while x < target_dist and y > 0:
-            v = np.sqrt(vx**2 + vy**2)
-            drag = 0.5 * rho * (v**2) * BaseballPhysics.CD * BaseballPhysics.AREA
-            # F = ma -> a = F/m (slugs)
-            ax = -(drag * (vx / v)) / 0.0097
-            ay = -BaseballPhysics.G - (drag * (vy / v)) / 0.0097
+        for _ in range(BaseballPhysics.MAX_STEPS):
+            if not active.any():
+                break
             
-            vx += ax * dt
-            vy += ay * dt
-            x += vx * dt
-            y += vy * dt
-        return y
-
-def calculate_advanced_stats(bip_data, stadium_info):
-    """Refined check: Past wall distance AND higher than wall height."""
-    expected_hr = 0
-    # Map zones: L (Left), C (Center), R (Right)
-    dists = {'L': stadium_info['left_field'], 'C': stadium_info['center_field'], 'R': stadium_info['right_field']}
-    heights = stadium_info['wall_heights']
+            ax1, ay1 = accel(vx, vy)
+            ax2, ay2 = accel(vx + 0.5 * dt * ax1, vy + 0.5 * dt * ay1)
+            ax3, ay3 = accel(vx + 0.5 * dt * ax2, vy + 0.5 * dt * ay2)
+            ax4, ay4 = accel(vx + dt * ax3, vy + dt * ay3)
+            x_next = x + dt / 6 * (6 * vx + dt * (ax1 + ax2 + ax3))
+            y_next = y + dt / 6 * (6 * vy + dt * (ay1 + ay2 + ay3))
+            
+            # Balls reaching the fence this step: interpolate the height at the fence
+            crossed = active & (x_next >= target_dist)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                fence_y = y + (y_next - y) * (target_dist - x) / (x_next - x)
+            height = np.where(crossed, fence_y, height)
+            
+            stepping = active & ~crossed
+            vx = np.where(stepping, vx + dt / 6 * (ax1 + 2 * ax2 + 2 * ax3 + ax4), vx)
+            vy = np.where(stepping, vy + dt / 6 * (ay1 + 2 * ay2 + 2 * ay3 + ay4), vy)
+            x = np.where(stepping, x_next, x)
+            y = np.where(stepping, y_next, y)
+            height = np.where(stepping, y, height)
+            active = stepping & (y > 0)
+        return height[()]
+
+
+_G = BaseballPhysics.G
+_CD = BaseballPhysics.CD
+_AREA = BaseballPhysics.AREA
+_DT = BaseballPhysics.DT
+_MAX_STEPS = BaseballPhysics.MAX_STEPS
+
 
-    for _, hit in bip_data.iterrows():
-        # Get spray angle (0 is dead center, negative is left, positive is right)
-        spray_angle = np.degrees(np.arctan2(hit['hc_x'] - 125.42, 198.27 - hit['hc_y']))
+def _accel(vx, vy, rho):
+    """Drag + gravity acceleration of a ball moving at (vx, vy)."""
+    v = math.sqrt(vx * vx + vy * vy)
+    k = 0.5 * rho * v * _CD * _AREA / 0.0097
+    return -k * vx, -_G - k * vy
+
+
+def _height_at_distance(v0_mph, launch_angle, target_dist, rho):
+    """Scalar RK4 loop for one trajectory, same steps as BaseballPhysics._integrate."""
+    v0 = v0_mph * 1.46667
+    theta = launch_angle * math.pi / 180
+    vx, vy = v0 * math.cos(theta), v0 * math.sin(theta)
+    x, y, dt = 0.0, 3.0, _DT
+    
+    for _ in range(_MAX_STEPS):
+        if not (x < target_dist and y > 0):
+            break
+        ax1, ay1 = _accel(vx, vy, rho)
+        ax2, ay2 = _accel(vx + 0.5 * dt * ax1, vy + 0.5 * dt * ay1, rho)
+        ax3, ay3 = _accel(vx + 0.5 * dt * ax2, vy + 0.5 * dt * ay2, rho)
+        ax4, ay4 = _accel(vx + dt * ax3, vy + dt * ay3, rho)
+        x_next = x + dt / 6 * (6 * vx + dt * (ax1 + ax2 + ax3))
+        y_next = y + dt / 6 * (6 * vy + dt * (ay1 + ay2 + ay3))
         
-        zone = 'L' if spray_angle < -15 else 'R' if spray_angle > 15 else 'C'
-        wall_d = dists[zone]
-        wall_h = heights[zone]
+        # Reached the fence inside this step: interpolate instead of stepping past it
+        if x_next >= target_dist:
+            return y + (y_next - y) * (target_dist - x) / (x_next - x)
         
-        ball_h_at_wall = BaseballPhysics.get_height_at_distance(
-            hit['launch_speed'], hit['launch_angle'], wall_d, stadium_info['altitude']
+        vx += dt / 6 * (ax1 + 2 * ax2 + 2 * ax3 + ax4)
+        vy += dt / 6 * (ay1 + 2 * ay2 + 2 * ay3 + ay4)
+        x, y = x_next, y_next
+    return y
+
+
+def _heights_batch(v0s, launch_angles, target_dists, rhos):
+    """Run _height_at_distance over every row, spread across cores."""
+    out = np.empty(v0s.shape[0])
+    for i in prange(v0s.shape[0]):
+        out[i] = _height_at_distance(v0s[i], launch_angles[i], target_dists[i], rhos[i])
+    return out
+
+
+_HEIGHT_INTERPOLATOR = None
+
+
+def _height_table():
+    """
+    Interpolator over heights precomputed on the BaseballPhysics TABLE_* grid.
+    Built on first use and saved to TABLE_PATH so later runs just load it.
+    """
+    global _HEIGHT_INTERPOLATOR
+    if _HEIGHT_INTERPOLATOR is not None:
+        return _HEIGHT_INTERPOLATOR
+    
+    grids = (BaseballPhysics.TABLE_V0, BaseballPhysics.TABLE_LA,
+             BaseballPhysics.TABLE_RHO, BaseballPhysics.TABLE_DIST)
+    table = None
+    try:
+        with np.load(BaseballPhysics.TABLE_PATH) as saved:
+            # Only reuse a saved table built on the same grid with the same constants
+            if (all(np.array_equal(saved[name], grid) for name, grid in zip(('v0', 'la', 'rho', 'dist'), grids))
+                    and np.array_equal(saved['constants'], _table_constants())):
+                table = saved['heights']
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        pass  # Missing, stale or truncated: rebuild it
+    
+    if table is None:
+        v0, la, dist = np.meshgrid(BaseballPhysics.TABLE_V0, BaseballPhysics.TABLE_LA,
+                                   BaseballPhysics.TABLE_DIST, indexing='ij')
+        table = np.stack([
+            BaseballPhysics.get_height_at_distance(v0, la, dist, rho) for rho in BaseballPhysics.TABLE_RHO
+        ], axis=2).astype(np.float32)
+        try:
+            # Write then rename so a killed run never leaves a truncated table behind
+            tmp_path = f"{BaseballPhysics.TABLE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, heights=table, v0=grids[0], la=grids[1],
+                         rho=grids[2], dist=grids[3], constants=_table_constants())
+            os.replace(tmp_path, BaseballPhysics.TABLE_PATH)
+        except OSError:
+            pass
+    
+    _HEIGHT_INTERPOLATOR = RegularGridInterpolator(grids, table, method='linear')
+    return _HEIGHT_INTERPOLATOR
+
+
+def _table_constants():
+    """Physics constants a saved height table depends on."""
+    return np.array([BaseballPhysics.G, BaseballPhysics.CD, BaseballPhysics.MASS,
+                     BaseballPhysics.AREA, BaseballPhysics.DT, BaseballPhysics.MAX_STEPS], dtype=np.float64)
+
+
+if NUMBA_AVAILABLE:
+    # fastmath without 'nnan'/'ninf' so NaN launch data still fails the loop test
+    _FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+    _accel = njit(cache=True, fastmath=_FASTMATH)(_accel)
+    _height_at_distance = njit(cache=True, fastmath=_FASTMATH)(_height_at_distance)
+    _heights_batch = njit(cache=True, fastmath=_FASTMATH, parallel=True)(_heights_batch)
+
+def calculate_advanced_stats(bip_data, stadium_info, use_table=True):
+    """
+    Refined check: Past wall distance AND higher than wall height.
+    Heights come from the precomputed trajectory table, integrating only balls outside its grid;
+    use_table=False integrates every ball.
+    """
+    if bip_data.empty:
+        return {"expected_hr": 0, "actual_hr": 0}
+    
+    # Pull every column out as a plain array once
+    hc_x = bip_data['hc_x'].to_numpy(dtype=np.float64)
+    hc_y = bip_data['hc_y'].to_numpy(dtype=np.float64)
+    launch_speed = bip_data['launch_speed'].to_numpy(dtype=np.float64)
+    launch_angle = bip_data['launch_angle'].to_numpy(dtype=np.float64)
+    hit_distance = bip_data['hit_distance_sc'].to_numpy(dtype=np.float64)
+    heights = stadium_info['wall_heights']
+    
+    # Get spray angle (0 is dead center, negative is left, positive is right)
+    spray_angle = np.degrees(np.arctan2(hc_x - 125.42, 198.27 - hc_y))
+    
+    # Map zones: 0 = L (Left), 1 = C (Center), 2 = R (Right)
+    zone_idx = np.where(spray_angle < -15, 0, np.where(spray_angle > 15, 2, 1))
+    dist_arr = np.array([stadium_info['left_field'], stadium_info['center_field'], stadium_info['right_field']], dtype=np.float64)
+    h_arr = np.array([heights['L'], heights['C'], heights['R']], dtype=np.float64)
+    wall_d = dist_arr[zone_idx]
+    wall_h = h_arr[zone_idx]
+    
+    # Only balls that carried to the wall can clear it, so only those are integrated (in one batch)
+    candidates = hit_distance >= wall_d
+    ball_h_at_wall = np.zeros(len(hit_distance))
+    if candidates.any():
+        height_fn = BaseballPhysics.get_height_from_table if use_table else BaseballPhysics.get_height_at_distance
+        # Parks from STADIUM_DATA carry their air density; compute it for anything else
+        rho = stadium_info['_rho'] if '_rho' in stadium_info else air_density(stadium_info['altitude'])
+        ball_h_at_wall[candidates] = height_fn(
+            launch_speed[candidates], launch_angle[candidates], wall_d[candidates], rho
         )
-        
-        if hit['hit_distance_sc'] >= wall_d and ball_h_at_wall > wall_h:
-            expected_hr += 1
+    
+    expected_hr = int(np.count_nonzero(candidates & (ball_h_at_wall > wall_h)))
+    actual_hr = int(np.count_nonzero(bip_data['events'].to_numpy() == 'home_run'))
             
-    return {"expected_hr": expected_hr, "actual_hr": len(bip_data[bip_data['events'] == 'home_run'])}
+    return {"expected_hr": expected_hr, "actual_hr": actual_hr}
+
+def calculate_advanced_stats_all_stadiums(bip_data, use_table=True):
+    """
+    calculate_advanced_stats for every stadium at once.
+    Balls in play form one axis and stadiums the other, so one integrator call covers the whole grid.
+    """
+    if bip_data.empty:
+        expected_hr, actual_hr = np.zeros(len(_NAMES), dtype=np.int64), 0
+    else:
+        hc_x = bip_data['hc_x'].to_numpy(dtype=np.float64)
+        hc_y = bip_data['hc_y'].to_numpy(dtype=np.float64)
+        launch_speed = bip_data['launch_speed'].to_numpy(dtype=np.float64)
+        launch_angle = bip_data['launch_angle'].to_numpy(dtype=np.float64)
+        hit_distance = bip_data['hit_distance_sc'].to_numpy(dtype=np.float64)
+        
+        spray_angle = np.degrees(np.arctan2(hc_x - 125.42, 198.27 - hc_y))
+        zone_idx = np.where(spray_angle < -15, 0, np.where(spray_angle > 15, 2, 1))
+        
+        # (N_bips, N_stadiums) fence distance/height for each ball's zone
+        dist_matrix, height_matrix = get_fence_params_vec(np.arange(len(_NAMES)), zone_idx[:, None])
+        
+        # Integrate only the (ball, stadium) pairs where the ball reached that park's wall
+        candidates = hit_distance[:, None] >= dist_matrix
+        ball_h = np.zeros(dist_matrix.shape)
+        rows, cols = np.nonzero(candidates)
+        if len(rows):
+            height_fn = BaseballPhysics.get_height_from_table if use_table else BaseballPhysics.get_height_at_distance
+            ball_h[rows, cols] = height_fn(launch_speed[rows], launch_angle[rows], dist_matrix[rows, cols], _RHO[cols])
+        
+        expected_hr = np.count_nonzero(candidates & (ball_h > height_matrix), axis=0)
+        actual_hr = int(np.count_nonzero(bip_data['events'].to_numpy() == 'home_run'))
+    
+    return pd.DataFrame({
+        'stadium_name': _NAMES,
+        'expected_hr': expected_hr,
+        'actual_hr': actual_hr
+    })
+
+def search_player(hitters_df, query):
+    """Case-insensitive substring search on hitter names."""
+    return hitters_df[hitters_df['_name_lower'].str.contains(query.lower(), regex=False)]
+
+def display_stadiums():
+    """Prints the numbered stadium table and returns it for selection."""
+    stadiums_df = get_stadium_dataframe()
+    stadiums_df['number'] = np.arange(1, len(stadiums_df) + 1)
+    stadiums_df['park_type'] = classify_park_factor(stadiums_df['park_factor'].to_numpy())
+    
+    print(stadiums_df[['number', 'stadium_name', 'team', 'city', 'park_factor', 'park_type']].to_string(
+        index=False, formatters={'park_factor': '{:.2f}'.format}
+    ))
+    return stadiums_df
 
 def main():
     print("\nMLB HITTER VS STADIUM: ADVANCED PHYSICS")
@@ -69,16 +344,15 @@ def main():
     hitters = get_all_hitters(year)
     
     query = input("\nEnter Player Name: ").strip()
-    matches = hitters[hitters['full_name'].str.contains(query, case=False, na=False)]
+    matches = search_player(hitters, query)
     if matches.empty: return
     
     player = matches.iloc[0]
-    stadiums_df = get_stadium_dataframe()
-    for i, name in enumerate(stadiums_df['stadium_name'], 1):
-        print(f"{i}. {name}")
+    display_stadiums()
     
     choice = int(input("\nSelect Stadium Number: "))
-    stadium_name = stadiums_df.iloc[choice-1]['stadium_name']
+    # Table rows are numbered in STADIUM_DATA order
+    stadium_name = _NAMES[choice - 1]
     stadium_info = STADIUM_DATA[stadium_name]
     
     bip_data = get_hitter_bip_stats(player['IDfg'], year)
@@ -86,6 +360,12 @@ def main():
     
     print(f"\nResults for {player['full_name']} at {stadium_name}:")
     print(f"Actual HRs: {results['actual_hr']} | Expected HRs: {results['expected_hr']}")
+    
+    # The same check at every park in one batched pass, to put the pick in context
+    all_parks = calculate_advanced_stats_all_stadiums(bip_data)
+    all_parks = all_parks.sort_values('expected_hr', ascending=False, kind='stable')
+    print("\nExpected HRs at every park:")
+    print(all_parks[['stadium_name', 'expected_hr']].to_string(index=False))
 
 if __name__ == "__main__":
     main()
@@ -10,7 +10,7 @@ from src.comparison import (
     get_stadium_rankings
 )
 from src.stadiums import get_stadium_dataframe
-from src.hitter_data import get_all_hitters
+from src.hitter_data import get_all_hitters, clear_disk_cache
 
 
 def main():
@@ -22,9 +22,15 @@ def main():
     parser.add_argument('--hitter', type=str, default=None, help='Analyze specific hitter by name')
     parser.add_argument('--list-stadiums', action='store_true', help='List all stadiums and exit')
     parser.add_argument('--list-hitters', action='store_true', help='List all hitters and exit')
+    parser.add_argument('--processes', action='store_true', help='Compare hitters in worker processes (up to one per CPU) instead of threads')
+    parser.add_argument('--refresh', action='store_true',
+                        help="Clear cached hitter/BIP frames (pybaseball's own download cache is kept)")
     
     args = parser.parse_args()
     
+    if args.refresh:
+        clear_disk_cache()
+    
     # List stadiums option
     if args.list_stadiums:
         stadiums_df = get_stadium_dataframe()
@@ -58,7 +64,8 @@ def main():
     comparisons_df = compare_all_hitters_to_stadiums(
         year=args.year,
         min_pa=args.min_pa,
-        top_n=args.top_n
+        top_n=args.top_n,
+        use_processes=args.processes
     )
     
     if len(comparisons_df) == 0:
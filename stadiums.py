@@ -3,8 +3,16 @@ MLB Stadium Information Module
 Updated 2026: Includes Wall Heights and Altitude for Physics Simulations.
 """
 
+import math
+import numpy as np
 import pandas as pd
 
+# --- PHYSICS HELPERS (needed to build the stadium tables below) ---
+
+def air_density(altitude):
+    """Air density (rho) at an elevation in feet."""
+    return 0.075 * math.exp(-altitude / 30000)
+
 # MLB Stadium data with dimensions, wall heights (ft), and altitude (ft)
 STADIUM_DATA = {
     'Yankee Stadium': {
@@ -79,11 +87,39 @@ STADIUM_DATA = {
     }
 }
 
+# Physics inputs that only depend on the park, computed once (underscore keys stay out of the DataFrame)
+for _stadium in STADIUM_DATA.values():
+    _stadium['_rho'] = air_density(_stadium['altitude'])
+
+# Built once at import; callers get a copy so they can add columns freely
+_STADIUM_DF = pd.DataFrame.from_dict(STADIUM_DATA, orient='index').reset_index().rename(columns={'index': 'stadium_name'})
+_STADIUM_DF = _STADIUM_DF.loc[:, ~_STADIUM_DF.columns.str.startswith('_')]
+
+# Struct-of-arrays view of STADIUM_DATA: slot i of every array is stadium _NAMES[i]
+_NAMES = list(STADIUM_DATA)
+_LF = np.array([s['left_field'] for s in STADIUM_DATA.values()], dtype=np.float64)
+_CF = np.array([s['center_field'] for s in STADIUM_DATA.values()], dtype=np.float64)
+_RF = np.array([s['right_field'] for s in STADIUM_DATA.values()], dtype=np.float64)
+_WH_L = np.array([s['wall_heights']['L'] for s in STADIUM_DATA.values()], dtype=np.float64)
+_WH_C = np.array([s['wall_heights']['C'] for s in STADIUM_DATA.values()], dtype=np.float64)
+_WH_R = np.array([s['wall_heights']['R'] for s in STADIUM_DATA.values()], dtype=np.float64)
+_PF = np.array([s['park_factor'] for s in STADIUM_DATA.values()], dtype=np.float64)
+_RHO = np.array([s['_rho'] for s in STADIUM_DATA.values()], dtype=np.float64)
+
+# (stadium, zone) tables with zones 0/1/2 = L/C/R
+_DISTS = np.column_stack([_LF, _CF, _RF])
+_HEIGHTS = np.column_stack([_WH_L, _WH_C, _WH_R])
+
 # --- HELPER FUNCTIONS ---
 
 def get_stadium_dataframe():
     """Returns a pandas DataFrame with all stadium information."""
-    return pd.DataFrame.from_dict(STADIUM_DATA, orient='index').reset_index().rename(columns={'index': 'stadium_name'})
+    return _STADIUM_DF.copy()
+
+def classify_park_factor(park_factor):
+    """Labels park factors (scalar or array) as Hitter-friendly, Pitcher-friendly, or Neutral."""
+    park_factor = np.asarray(park_factor)
+    return np.select([park_factor > 1.05, park_factor < 0.95], ['Hitter-friendly', 'Pitcher-friendly'], 'Neutral')
 
 def get_stadium_info(stadium_name):
     """Get information for a specific stadium."""
@@ -106,3 +142,12 @@ def get_fence_params(stadium_name, spray_angle):
         return s['center_field'], s['wall_heights']['C']
     else:
         return s['right_field'], s['wall_heights']['R']
+
+def get_fence_params_vec(stadium_idx, zone_idx):
+    """
+    Array version of get_fence_params.
+    Args:
+        stadium_idx: int or int array (positions in STADIUM_DATA order, see _NAMES)
+        zone_idx: int array (0 = L, 1 = C, 2 = R), broadcast against stadium_idx
+    """
+    return _DISTS[stadium_idx, zone_idx], _HEIGHTS[stadium_idx, zone_idx]
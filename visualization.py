@@ -1,32 +1,76 @@
+import math
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
 import pandas as pd
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import LinearSegmentedColormap, Normalize
 from scipy.interpolate import interp1d
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; the trajectory kernels then run as plain Python
+    NUMBA_AVAILABLE = False
+
+# Above this many balls, per-point scatter coloring gets slow; bin xBA into hexagons instead
+HEXBIN_MIN_POINTS = 2000
+
+# xBA colormap, built once rather than on every heatmap
+_XBA_CMAP = LinearSegmentedColormap.from_list('xba', ['red', 'orange', 'yellow', 'green'])
+_XBA_NORM = Normalize(vmin=0, vmax=0.8)
+
 class TrajectorySim:
     """Simulates 3D flight to check wall clearance."""
     @staticmethod
     def calculate_height_at_fence(v0_mph, launch_angle, target_dist, altitude):
-        # Air density adjustment for altitude
-        rho = 0.075 * np.exp(-altitude / 30000)
-        v0 = v0_mph * 1.46667
-        theta = np.radians(launch_angle)
-        vx, vy = v0 * np.cos(theta), v0 * np.sin(theta)
-        x, y, dt = 0.0, 3.0, 0.01 
-        
-        while x < target_dist and y > 0:
-            v = np.sqrt(vx**2 + vy**2)
-            # Drag calculation (Cd=0.3, Area=0.0458, Mass=0.0097)
-            f_drag = 0.5 * rho * v**2 * 0.3 * 0.0458
-            ax = -(f_drag * (vx / v)) / 0.0097
-            ay = -32.17 - (f_drag * (vy / v)) / 0.0097
-            vx += ax * dt
-            vy += ay * dt
-            x += vx * dt
-            y += vy * dt
-        return y
+        return _height_at_fence(v0_mph, launch_angle, target_dist, altitude)
+
+    @staticmethod
+    def calculate_heights_at_fence(v0_mph, launch_angle, target_dist, altitude):
+        """Batched calculate_height_at_fence over every ball."""
+        v0_mph, launch_angle, target_dist = (np.ravel(a).astype(np.float64) for a in np.broadcast_arrays(
+            v0_mph, launch_angle, target_dist))
+        return _heights_at_fence(v0_mph, launch_angle, target_dist, float(altitude))
+
+def _height_at_fence(v0_mph, launch_angle, target_dist, altitude):
+    """Euler-steps one ball to the fence; compiled by Numba when available, plain Python otherwise."""
+    rho = 0.075 * math.exp(-altitude / 30000)
+    v0 = v0_mph * 1.46667
+    theta = launch_angle * math.pi / 180.0
+    vx, vy = v0 * math.cos(theta), v0 * math.sin(theta)
+    x, y, dt = 0.0, 3.0, 0.01
+    
+    while x < target_dist and y > 0:
+        v = math.sqrt(vx * vx + vy * vy)
+        if v == 0:
+            return math.nan  # 0 mph: no drag direction, NaN as NumPy's 0/0 gives (never a home run)
+        # Drag calculation (Cd=0.3, Area=0.0458, Mass=0.0097)
+        f_drag = 0.5 * rho * (v * v) * 0.3 * 0.0458
+        ax = -(f_drag * (vx / v)) / 0.0097
+        ay = -32.17 - (f_drag * (vy / v)) / 0.0097
+        vx += ax * dt
+        vy += ay * dt
+        x += vx * dt
+        y += vy * dt
+    return y
+
+def _heights_at_fence(v0s, launch_angles, target_dists, altitude):
+    """Runs _height_at_fence over every ball."""
+    out = np.empty(v0s.shape[0])
+    for i in range(v0s.shape[0]):
+        out[i] = _height_at_fence(v0s[i], launch_angles[i], target_dists[i], altitude)
+    return out
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile at import (or load from the cache), so the first plot pays no JIT cost;
+    # fastmath without 'nnan'/'ninf' so NaN launch data still fails the loop test, and NumPy's
+    # error model so a stray division gives NaN/inf rather than raising
+    _FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+    _height_at_fence = njit('float64(float64, float64, float64, float64)',
+                            cache=True, fastmath=_FASTMATH, error_model='numpy')(_height_at_fence)
+    _heights_at_fence = njit('float64[::1](float64[::1], float64[::1], float64[::1], float64)',
+                             cache=True, fastmath=_FASTMATH, error_model='numpy')(_heights_at_fence)
 
 def create_field_plot():
     """Creates a standardized field diagram."""
@@ -47,6 +91,27 @@ def create_field_plot():
     
     return fig, ax
 
+# Spray angles (degrees) splitting the left/center/right wall zones
+_ZONE_EDGES = np.array([-15.0, 15.0])
+
+def calculate_expected_home_runs(bip_data, spray_angle, stadium_info):
+    """Counts balls that carry past their zone's wall distance and clear its height."""
+    heights = stadium_info['wall_heights']
+    # Zone index per ball (0=L below -15, 1=C below 15, 2=R otherwise, including NaN) in one sorted lookup
+    zone = np.searchsorted(_ZONE_EDGES, spray_angle, side='right')
+    wall_dist = np.array([stadium_info['left_field'], stadium_info['center_field'],
+                          stadium_info['right_field']], dtype=np.float64)[zone]
+    wall_height = np.array([heights['L'], heights['C'], heights['R']], dtype=np.float64)[zone]
+    alt = stadium_info.get('altitude', 0)
+    
+    ball_h = TrajectorySim.calculate_heights_at_fence(
+        bip_data['launch_speed'].to_numpy(), bip_data['launch_angle'].to_numpy(), wall_dist, alt
+    )
+    
+    # Must be past distance AND clear the height
+    past_wall = bip_data['hit_distance_sc'].to_numpy() >= wall_dist
+    return int(np.count_nonzero(past_wall & (ball_h > wall_height)))
+
 def plot_bip_heatmap(bip_data, stadium_info, player_name="Player"):
     """Main visualization logic with foul-ball and wall-height correction."""
     if bip_data.empty:
@@ -55,60 +120,76 @@ def plot_bip_heatmap(bip_data, stadium_info, player_name="Player"):
     fig, ax = create_field_plot()
     
     # 1. Correct Spray Angle (Applying the 0.75 correction factor)
-    bip_data['spray_angle'] = np.degrees(
-        np.arctan((bip_data['hc_x'] - 125.42) / (198.27 - bip_data['hc_y']))
-    ) * 0.75
+    # Plain arrays, so nothing is written back into the caller's (possibly shared) frame
+    hc_x = bip_data['hc_x'].to_numpy(dtype=np.float64)
+    hc_y = bip_data['hc_y'].to_numpy(dtype=np.float64)
+    # Kept in radians for the coordinates; degrees only for the wall zones.
+    # Built up in one buffer (hc_x - 125.42 is already a fresh array) instead of a temporary per step
+    angle_rad = hc_x - 125.42
+    angle_rad /= 198.27 - hc_y
+    np.arctan(angle_rad, out=angle_rad)
+    angle_rad *= 0.75
+    spray_angle = np.degrees(angle_rad)
     
     # Use hit_distance_sc for Y, calculate X based on adjusted spray angle
-    dist = bip_data['hit_distance_sc'].fillna(0)
-    angle_rad = np.radians(bip_data['spray_angle'])
-    x_coords = dist * np.sin(angle_rad)
-    y_coords = dist * np.cos(angle_rad)
+    # fillna copies the whole column, so only pay for it when a distance is actually missing
+    dist = bip_data['hit_distance_sc']
+    dist = (dist.fillna(0) if dist.hasnans else dist).to_numpy(dtype=np.float64)
+    x_coords = np.sin(angle_rad)
+    x_coords *= dist
+    y_coords = np.cos(angle_rad)
+    y_coords *= dist
 
     # 2. 3D Wall Analysis
-    expected_hr = 0
-    alt = stadium_info.get('altitude', 0)
-    
-    def get_zone_specs(angle):
-        if angle < -15: return stadium_info['left_field'], stadium_info['wall_heights']['L']
-        if angle < 15:  return stadium_info['center_field'], stadium_info['wall_heights']['C']
-        return stadium_info['right_field'], stadium_info['wall_heights']['R']
-
-    for i, row in bip_data.iterrows():
-        w_dist, w_height = get_zone_specs(row['spray_angle'])
-        ball_h = TrajectorySim.calculate_height_at_fence(row['launch_speed'], row['launch_angle'], w_dist, alt)
-        
-        # Must be past distance AND clear the height
-        if (row['hit_distance_sc'] >= w_dist) and (ball_h > w_height):
-            expected_hr += 1
+    expected_hr = calculate_expected_home_runs(bip_data, spray_angle, stadium_info)
 
     # 3. Render Heatmap
-    cmap = LinearSegmentedColormap.from_list('xba', ['red', 'orange', 'yellow', 'green'])
-    scatter = ax.scatter(x_coords, y_coords, c=bip_data['estimated_ba_using_speedangle'], 
-                        cmap=cmap, s=40, alpha=0.7, edgecolors='none', vmin=0, vmax=0.8)
+    xba = bip_data['estimated_ba_using_speedangle'].to_numpy(dtype=np.float64)
+    if len(bip_data) > HEXBIN_MIN_POINTS:
+        # Mean xBA per hexagon; balls without coordinates or xBA are left out, as scatter leaves them invisible.
+        # One combined mask, applied once to each plain array
+        plotted = np.isfinite(x_coords) & np.isfinite(y_coords) & np.isfinite(xba)
+        mappable = ax.hexbin(x_coords[plotted], y_coords[plotted], C=xba[plotted], gridsize=40,
+                            reduce_C_function=np.mean, extent=(-250, 250, -50, 480),
+                            cmap=_XBA_CMAP, alpha=0.7, edgecolors='none', vmin=0, vmax=0.8)
+    else:
+        # Colormap the points once up front; plain RGBA faces skip norm + colormap on every redraw.
+        # Alpha goes through the colormap so missing xBA keeps its fully transparent 'bad' color
+        ax.scatter(x_coords, y_coords, c=_XBA_CMAP(_XBA_NORM(xba), alpha=0.7), s=40, edgecolors='none')
+        mappable = ScalarMappable(norm=_XBA_NORM, cmap=_XBA_CMAP)
     
     draw_stadium_fence(ax, stadium_info)
     
-    plt.colorbar(scatter, ax=ax, label='xBA', orientation='horizontal', pad=0.05)
+    fig.colorbar(mappable, ax=ax, label='xBA', orientation='horizontal', pad=0.05, alpha=0.7)
     ax.set_title(f"{player_name} at {stadium_info['stadium_name']}\nProjected HRs: {expected_hr}", fontsize=14)
     
     return fig, ax
 
+# Fence curve sample angles, and the cubic spline through the 5 measured points as a
+# (100, 5) matrix: the spline is linear in the distances, so each fence is one matmul
+_FENCE_ANGLES = [-45, -22.5, 0, 22.5, 45]
+_FENCE_CURVE_ANGLES = np.linspace(-45, 45, 100)
+_FENCE_SPLINE = interp1d(_FENCE_ANGLES, np.eye(len(_FENCE_ANGLES)), kind='cubic', axis=0)(_FENCE_CURVE_ANGLES)
+# The angles never change, so their sines/cosines are fixed too
+_FENCE_CURVE_SIN = np.sin(np.radians(_FENCE_CURVE_ANGLES))
+_FENCE_CURVE_COS = np.cos(np.radians(_FENCE_CURVE_ANGLES))
+_FENCE_LABEL_SIN = np.sin(np.radians(_FENCE_ANGLES))
+_FENCE_LABEL_COS = np.cos(np.radians(_FENCE_ANGLES))
+
 def draw_stadium_fence(ax, stadium_info):
     """Draws a smooth fence line based on stadium dimensions."""
-    angles = [-45, -22.5, 0, 22.5, 45]
     dists = [stadium_info['left_field'], stadium_info['left_center'], 
              stadium_info['center_field'], stadium_info['right_center'], stadium_info['right_field']]
     
-    f = interp1d(angles, dists, kind='cubic')
-    f_angles = np.linspace(-45, 45, 100)
-    f_dists = f(f_angles)
+    f_dists = _FENCE_SPLINE @ np.asarray(dists, dtype=np.float64)
     
-    fx = f_dists * np.sin(np.radians(f_angles))
-    fy = f_dists * np.cos(np.radians(f_angles))
+    fx = f_dists * _FENCE_CURVE_SIN
+    fy = f_dists * _FENCE_CURVE_COS
     ax.plot(fx, fy, color='blue', linewidth=3, label="Fence")
 
-    for a, d in zip(angles, dists):
-        lx, ly = d * np.sin(np.radians(a)), d * np.cos(np.radians(a))
-        ax.text(lx, ly + 10, f"{d}ft", ha='center', fontweight='bold',
+    # Label positions for all five measured points at once
+    lx = np.asarray(dists) * _FENCE_LABEL_SIN
+    ly = np.asarray(dists) * _FENCE_LABEL_COS
+    for x, y, d in zip(lx, ly, dists):
+        ax.text(x, y + 10, f"{d}ft", ha='center', fontweight='bold',
                 bbox=dict(facecolor='yellow', alpha=0.6, edgecolor='none'))